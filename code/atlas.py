@@ -0,0 +1,117 @@
+import json
+import pygame
+from settings import TILE_SIZE
+from support import p
+
+ATLAS_IMAGE = ('data', 'graphics', 'atlas.png')
+ATLAS_INDEX = ('data', 'graphics', 'atlas.json')
+TILESET = ('data', 'graphics', 'Tilemap.png')
+PADDING = 1
+
+# =========================
+# Atlas Builder
+# =========================
+
+def _source_images():
+    """Collect every animation folder / single image under images/ plus the tileset"""
+    entries = {}
+    for path in sorted(p('images').rglob('*.png')):
+        rel = path.relative_to(p('images'))
+        if path.stem.isdigit():
+            entries.setdefault(rel.parent.as_posix(), []).append(path)
+        else:
+            entries[rel.with_suffix('').as_posix()] = [path]
+    for paths in entries.values():
+        paths.sort(key=lambda f: int(f.stem) if f.stem.isdigit() else 0)
+    entries['tiles'] = [p(*TILESET)]
+    return entries
+
+
+def _pack(sizes, width):
+    """Shelf-pack (w, h) sizes into rows of the given width, tallest first"""
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions = [None] * len(sizes)
+    x = y = shelf_h = 0
+    for i in order:
+        w, h = sizes[i]
+        if x and x + w > width:
+            x, y, shelf_h = 0, y + shelf_h + PADDING, 0
+        positions[i] = (x, y)
+        x += w + PADDING
+        shelf_h = max(shelf_h, h)
+    return positions, y + shelf_h
+
+
+def build_atlas():
+    """Pack all frames and the tileset into one sheet and write its JSON index"""
+    entries = _source_images()
+    keys, surfs = [], []
+    for key, paths in entries.items():
+        for path in paths:
+            keys.append(key)
+            surfs.append(pygame.image.load(path))
+
+    sizes = [s.get_size() for s in surfs]
+    width = max(w for w, _ in sizes)
+    positions, height = _pack(sizes, width)
+
+    sheet = pygame.Surface((width, height), pygame.SRCALPHA)
+    index = {'frames': {}, 'tile_size': TILE_SIZE}
+    for key, surf, (x, y) in zip(keys, surfs, positions):
+        sheet.blit(surf, (x, y))
+        index['frames'].setdefault(key, []).append([x, y, *surf.get_size()])
+
+    pygame.image.save(sheet, str(p(*ATLAS_IMAGE)))
+    with open(p(*ATLAS_INDEX), 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    return index
+
+
+# =========================
+# Atlas Loader
+# =========================
+
+class Atlas:
+    """Serves animation frames and map tiles as subsurfaces of one packed sheet"""
+
+    def __init__(self):
+        if not p(*ATLAS_IMAGE).exists() or not p(*ATLAS_INDEX).exists():
+            build_atlas()
+        with open(p(*ATLAS_INDEX), encoding='utf-8') as f:
+            index = json.load(f)
+        self.rects = {key: [pygame.Rect(r) for r in rects] for key, rects in index['frames'].items()}
+        self.tile_size = index['tile_size']
+        self.sheets = {1: pygame.image.load(p(*ATLAS_IMAGE)).convert_alpha()}
+        self.tile_cache = {}
+
+    def sheet(self, scale=1):
+        """Whole atlas scaled once per factor, so scaled frames still share one surface"""
+        if scale not in self.sheets:
+            base = self.sheets[1]
+            self.sheets[scale] = pygame.transform.scale(base, (base.get_width() * scale, base.get_height() * scale))
+        return self.sheets[scale]
+
+    def _sub(self, rect, scale):
+        return self.sheet(scale).subsurface(rect.x * scale, rect.y * scale, rect.w * scale, rect.h * scale)
+
+    def frames(self, *path, scale=1):
+        """Animation frames for e.g. ('player', 'idle')"""
+        return [self._sub(rect, scale) for rect in self.rects['/'.join(path)]]
+
+    def image(self, *path, scale=1):
+        """Single image for e.g. ('gun', 'bullet')"""
+        return self.frames(*path, scale=scale)[0]
+
+    def tile(self, tile_id, scale=1):
+        """Tileset tile by its local id (tiled gid - firstgid)"""
+        if (tile_id, scale) not in self.tile_cache:
+            sheet_rect, size = self.rects['tiles'][0], self.tile_size
+            row, col = divmod(tile_id, sheet_rect.w // size)
+            rect = pygame.Rect(sheet_rect.x + col * size, sheet_rect.y + row * size, size, size)
+            self.tile_cache[(tile_id, scale)] = self._sub(rect, scale)
+        return self.tile_cache[(tile_id, scale)]
+
+
+if __name__ == '__main__':
+    index = build_atlas()
+    print(f"Packed {sum(len(r) for r in index['frames'].values())} images into {p(*ATLAS_IMAGE)}")
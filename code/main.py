@@ -6,7 +6,8 @@ from sprites import *
 from groups import AllSprites
 from support import *
 from timer import Timer
-from pytmx.util_pygame import load_pygame
+from atlas import Atlas
+from pytmx import TiledMap
 
 # =========================
 # Main Game Class
@@ -109,22 +110,22 @@ class Game:
         """Load images, sounds, and animations"""
         sf = SCALE
 
+        # All frames and tiles come from one packed sheet (see atlas.py)
+        self.atlas = Atlas()
+
         # Player animations (scaled)
         self.player_anims = {
-            state: [pygame.transform.scale(img, (img.get_width() * sf, img.get_height() * sf))
-                    for img in import_folder('images', 'player', state)]
+            state: self.atlas.frames('player', state, scale=sf)
             for state in ['idle', 'run', 'jump']
         }
 
         # Bullets & fire (original size)
-        self.bullet_surf = import_image('images', 'gun', 'bullet')
-        self.fire_surf = import_image('images', 'gun', 'fire')
+        self.bullet_surf = self.atlas.image('gun', 'bullet')
+        self.fire_surf = self.atlas.image('gun', 'fire')
 
         # Enemies (scaled)
-        self.bee_frames = [pygame.transform.scale(img, (img.get_width() * sf, img.get_height() * sf))
-                           for img in import_folder('images', 'enemies', 'bee')]
-        self.snake_frames = [pygame.transform.scale(img, (img.get_width() * sf, img.get_height() * sf))
-                             for img in import_folder('images', 'enemies', 'snake')]
+        self.bee_frames = self.atlas.frames('enemies', 'bee', scale=sf)
+        self.snake_frames = self.atlas.frames('enemies', 'snake', scale=sf)
 
         # Load sound effects and music
         self.audio = audio_importer('audio')
@@ -138,32 +139,34 @@ class Game:
         tmx_path = p('data', 'maps', 'world.tmx')
         if not tmx_path.exists():
             raise FileNotFoundError(f"TMX not found: {tmx_path}")
-        tmx_map = load_pygame(str(tmx_path))
+        tmx_map = TiledMap(str(tmx_path))  # no image loader: tiles are served from the atlas
 
         # Calculate scaled map dimensions
         self.level_width = tmx_map.width * TILE_SIZE * sf
         self.level_height = tmx_map.height * TILE_SIZE * sf
 
-        def scaled(img):
-            return pygame.transform.scale(img, (img.get_width() * sf, img.get_height() * sf))
+        def layer_tiles(name):
+            for x, y, gid in tmx_map.get_layer_by_name(name).iter_data():
+                if gid:
+                    tile_id = tmx_map.tiledgidmap[gid] - tmx_map.get_tileset_from_gid(gid).firstgid
+                    yield x, y, self.atlas.tile(tile_id, sf)
 
         # --- Layers ---
         # Background layer
         if 'background' in [l.name for l in tmx_map.layers]:
-            for x, y, image in tmx_map.get_layer_by_name('background').tiles():
-                Sprite((x * TILE_SIZE * sf, y * TILE_SIZE * sf), scaled(image), self.all_sprites)
+            for x, y, image in layer_tiles('background'):
+                Sprite((x * TILE_SIZE * sf, y * TILE_SIZE * sf), image, self.all_sprites)
 
         # Main (solid ground + walls)
-        for x, y, image in tmx_map.get_layer_by_name('Main').tiles():
+        for x, y, image in layer_tiles('Main'):
             wx, wy = x * TILE_SIZE * sf, y * TILE_SIZE * sf
-            disp_img = scaled(image)
-            Sprite((wx, wy), disp_img, self.all_sprites)
-            CollisionTile((wx, wy), disp_img, self.collision_sprites)
+            Sprite((wx, wy), image, self.all_sprites)
+            CollisionTile((wx, wy), image, self.collision_sprites)
 
         # Decoration layer
         if 'Decoration' in [l.name for l in tmx_map.layers]:
-            for x, y, image in tmx_map.get_layer_by_name('Decoration').tiles():
-                Sprite((x * TILE_SIZE * sf, y * TILE_SIZE * sf), scaled(image), self.all_sprites)
+            for x, y, image in layer_tiles('Decoration'):
+                Sprite((x * TILE_SIZE * sf, y * TILE_SIZE * sf), image, self.all_sprites)
 
         # --- Objects ---
         for obj in tmx_map.get_layer_by_name('object'):